@@ -12,6 +12,7 @@ import sys
 import os
 import glob
 import warnings
+from functools import lru_cache
 
 MKL = 'mkl'
 OBLAS = 'openblas'
@@ -135,8 +136,13 @@ def get_blas_osys(numpy_module, osys):
     return None
 
 
+@lru_cache()
 def get_blas(numpy_module):
-    """Return BLAS object or None if neither MKL nor OpenBLAS is found."""
+    """Return BLAS object or None if neither MKL nor OpenBLAS is found.
+
+    The lookup shells out to ldd/otool, so the result is cached per
+    NumPy module for the life of the process.
+    """
 
     if sys.platform.startswith('linux'):
         # return get_blas_linux(numpy_module)
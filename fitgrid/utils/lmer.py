@@ -58,12 +58,13 @@ def get_lmer_dfbetas(epochs, factor, **kwargs):
     table = epochs.table.reset_index().set_index(
         [epochs.epoch_id, epochs.time]
     )
-    levels = table[factor].unique()
+    factor_values = table[factor].to_numpy()
+    levels = pd.unique(factor_values)
 
     # produce epochs tables with each level left out
     looo_epochs = (
         fitgrid.epochs_from_dataframe(
-            table[table[factor] != level],
+            table.iloc[np.flatnonzero(factor_values != level)],
             time=epochs.time,
             epoch_id=epochs.epoch_id,
             channels=epochs.channels,
@@ -76,20 +77,15 @@ def get_lmer_dfbetas(epochs, factor, **kwargs):
     grids = map(fitter, looo_epochs)
     coefs = (grid.coefs for grid in grids)
 
-    # get coefficient estimates and se from leave one out fits
-    looo_coefs = pd.concat(coefs, keys=levels, axis=1)
-    looo_estimates = looo_coefs.loc[pd.IndexSlice[:, :, 'Estimate'], :]
-    looo_se = looo_coefs.loc[pd.IndexSlice[:, :, 'SE'], :]
+    # get coefficient estimates and se from leave one out fits, xs drops
+    # the innermost key level for convenience
+    looo_coefs = pd.concat(coefs, keys=levels, axis=1, sort=False)
+    looo_estimates = looo_coefs.xs('Estimate', level=-1)
+    looo_se = looo_coefs.xs('SE', level=-1)
 
     # get coefficient estimates from regular fit (all levels included)
     all_levels_coefs = fitgrid.lmer(epochs, **kwargs).coefs
-    all_levels_estimates = all_levels_coefs.loc[
-        pd.IndexSlice[:, :, 'Estimate'], :
-    ]
-
-    # drop outer level of index for convenience
-    for df in (looo_estimates, looo_se, all_levels_estimates):
-        df.index = df.index.droplevel(level=-1)
+    all_levels_estimates = all_levels_coefs.xs('Estimate', level=-1)
 
     # (all_levels_estimate - level_excluded_estimate) / level_excluded_se
     dfbetas = all_levels_estimates.sub(looo_estimates, level=1).div(
@@ -7,6 +7,9 @@ import itertools
 import copy
 import warnings
 import re
+from functools import lru_cache
+from multiprocessing import Pool
+from tqdm import tqdm
 from cycler import cycler as cy
 from collections import defaultdict
 import pprint as pp
@@ -87,7 +90,9 @@ def summarize(
        and the R library `lme4` docs for the `lmer` formula language.
 
     parallel : bool
-       If True, model fitting is distributed to multiple cores
+       If True, model fitting is distributed to multiple cores. When there
+       are at least as many RHS formulas as cores, whole models are fit
+       in parallel, otherwise the time points of each model are.
 
     n_cores : int
        number of cores to use. See what works, but golden rule if running
@@ -171,22 +176,36 @@ def summarize(
     # promote RHS scalar str to singleton list
     RHS = np.atleast_1d(RHS).tolist()
 
-    # loop through model formulas fitting and scraping summaries
-    summaries = []
-    for _rhs in RHS:
-        summaries.append(
-            _scraper(
-                _modeler(
-                    epochs_fg,
-                    LHS=LHS,
-                    RHS=_rhs,
-                    parallel=parallel,
-                    n_cores=n_cores,
-                    quiet=quiet,
-                    **kwargs,
+    # with enough formulas to go around, fit and scrape whole models
+    # in parallel, else parallelize the time points of each model in turn
+    if parallel and 1 < n_cores <= len(RHS):
+        # ship the epochs to each worker once, then map just the RHS
+        fit_kwargs = dict(LHS=LHS, parallel=False, n_cores=1, quiet=True)
+        fit_kwargs.update(kwargs)
+        with fitgrid.tools.single_threaded(np):
+            with Pool(
+                n_cores,
+                initializer=_init_fit_summary_worker,
+                initargs=(epochs_fg, _modeler, _scraper, fit_kwargs),
+            ) as pool:
+                summaries = pool.map(
+                    _fit_summary_worker, tqdm(RHS, disable=quiet), chunksize=1
                 )
+    else:
+        summaries = [
+            _fit_summary(
+                _rhs,
+                epochs_fg=epochs_fg,
+                modeler=_modeler,
+                scraper=_scraper,
+                LHS=LHS,
+                parallel=parallel,
+                n_cores=n_cores,
+                quiet=quiet,
+                **kwargs,
             )
-        )
+            for _rhs in RHS
+        ]
 
     summary_df = pd.concat(summaries)
     _check_summary_df(summary_df, epochs_fg)
@@ -197,6 +216,27 @@ def summarize(
 # ------------------------------------------------------------
 # private-ish summary helpers for scraping summary info from fits
 # ------------------------------------------------------------
+def _fit_summary(rhs, epochs_fg, modeler, scraper, **kwargs):
+    """fit one model formula and scrape its summary, module level for Pool"""
+    return scraper(modeler(epochs_fg, RHS=rhs, **kwargs))
+
+
+# per-process fitting state for summarize() Pool workers
+_worker_fit_args = None
+
+
+def _init_fit_summary_worker(epochs_fg, modeler, scraper, kwargs):
+    """Pool initializer, receive the epochs and fitting args once"""
+    global _worker_fit_args
+    _worker_fit_args = (epochs_fg, modeler, scraper, kwargs)
+
+
+def _fit_summary_worker(rhs):
+    """fit and scrape one model formula with the worker's epochs"""
+    epochs_fg, modeler, scraper, kwargs = _worker_fit_args
+    return _fit_summary(rhs, epochs_fg, modeler, scraper, **kwargs)
+
+
 def _check_summary_df(summary_df, fg_obj):
     """check summary df structure, and against the fitgrid object if any"""
     # fg_obj can be fitgrid.Epochs, LMGrid or LMERGrid, they all have a time attribute
@@ -272,29 +312,25 @@ def _stringify_lmer_warnings(fg_lmer):
     warning_grids = fitgrid.utils.lmer.get_lmer_warnings(
         fg_lmer
     )  # dict of indicator dataframes
+    warning_strings = np.full(fg_lmer._grid.shape, "", dtype=object)
+
+    # collect multiple warnings into single sorted "_" separated strings
+    # on a tidy time x channel grid, whole grid at a time in sorted order
+    for warning in sorted(warning_grids.keys()):
+        has_warning = warning_grids[warning].to_numpy().astype(bool)
+        warning_strings = np.where(
+            has_warning,
+            np.where(
+                warning_strings == "", warning, warning_strings + "_" + warning
+            ),
+            warning_strings,
+        )
+
     warning_string_grid = pd.DataFrame(
-        np.full(fg_lmer._grid.shape, ""),
+        warning_strings,
         index=fg_lmer._grid.index.copy(),
         columns=fg_lmer._grid.columns.copy(),
     )
-
-    # collect multiple warnings into single sorted "_" separated strings
-    # on a tidy time x channel grid
-    for warning, warning_grid in warning_grids.items():
-        for idx, row_vals in warning_grid.iterrows():
-            for jdx, col_val in row_vals.iteritems():
-                if col_val:
-                    if len(warning_string_grid.loc[idx, jdx]) == 0:
-                        warning_string_grid.loc[idx, jdx] = warning
-                    else:
-                        # split, sort, reassemble
-                        wrns = "_".join(
-                            sorted(
-                                warning_string_grid.loc[idx, jdx].split("_")
-                                + [warning]
-                            )
-                        )
-                        warning_string_grid.loc[idx, jdx] = wrns
     return warning_string_grid
 
 
@@ -527,6 +563,8 @@ def _lmer_get_summaries_df(fg_lmer):
     summaries_df.reset_index(['key', 'beta'], inplace=True)
 
     # scrape AIC and other useful 1-D fit attributes into summaries_df
+    betas = summaries_df['beta'].unique()
+    attrib_dfs = [summaries_df]
     for attrib in pymer_attribs + list(derived_attribs.keys()):
         # LOGGER.info(attrib)
 
@@ -540,14 +578,16 @@ def _lmer_get_summaries_df(fg_lmer):
         attrib_df.insert(1, 'key', attrib)
 
         # propagate attributes to each beta ... wasteful but tidy
-        # when grouping by beta
-        for beta in summaries_df['beta'].unique():
-            beta_attrib = attrib_df.copy().set_index('model', append=True)
-            beta_attrib.insert(0, 'beta', beta)
-            summaries_df = summaries_df.append(beta_attrib)
+        # when grouping by beta, one block of rows per beta
+        attrib_df = attrib_df.set_index('model', append=True)
+        beta_attribs = pd.concat([attrib_df] * len(betas))
+        beta_attribs.insert(0, 'beta', np.repeat(betas, len(attrib_df)))
+        attrib_dfs.append(beta_attribs)
 
+    # one concat, not a copy of the growing frame per beta x attribute
     summaries_df = (
-        summaries_df.reset_index()
+        pd.concat(attrib_dfs)
+        .reset_index()
         .set_index(_index_names)  # INDEX_NAMES)
         .sort_index()
         #        .astype(float)
@@ -575,22 +615,23 @@ def _get_AICs(summary_df):
     # AIC and lmer warnings are 1 per model, pull from the first
     # model coefficient only, e.g., (Intercept)
     aic_cols = ["AIC", "has_warning", "warnings"]
-    aics = []
+    first_params = []
     # for model, model_data in summary_df.groupby('model'):
     # groupby processes models in alphabetical sort order
     for model in summary_df.index.unique('model'):
-        model_data = summary_df.query("model==@model")
+        model_data = summary_df.xs(model, level='model', drop_level=False)
         first_param = model_data.index.get_level_values('beta').unique()[0]
-        aic = pd.DataFrame(
-            summary_df.loc[pd.IndexSlice[:, model, first_param, aic_cols], :]
-            .stack(-1)
-            .unstack("key")
-            .reset_index(["beta"], drop=True),
-            columns=aic_cols,
-        )
-        aic.index.names = aic.index.names[:-1] + ["channel"]
-        aics += [aic]
-    AICs = pd.concat(aics)
+        first_params.append(model_data.xs(first_param, level='beta'))
+    first_param_data = pd.concat(first_params)
+
+    # reshape all the models at once, one long column per key aligned
+    # on time, model, channel
+    AICs = pd.concat(
+        [first_param_data.xs(key, level='key').stack() for key in aic_cols],
+        axis=1,
+        keys=aic_cols,
+    )
+    AICs.index.names = AICs.index.names[:-1] + ["channel"]
     assert set(summary_df.index.unique('model')) == set(
         AICs.index.unique('model')
     )
@@ -603,17 +644,15 @@ def _get_AICs(summary_df):
         inplace=True,
     )
 
-    # calculate AIC_min for the fitted models at each time, channel
-    AICs['min_delta'] = np.inf  # init to float
-
     # time label is the first index level, may not be fitgrid.defaults.TIME
     assert AICs.index.names == summary_df.index.names[:2] + ["channel"]
-    for time in AICs.index.get_level_values(0).unique():
-        for chan in AICs.index.get_level_values('channel').unique():
-            slicer = pd.IndexSlice[time, :, chan]
-            AICs.loc[slicer, 'min_delta'] = AICs.loc[slicer, 'AIC'] - min(
-                AICs.loc[slicer, 'AIC']
-            )
+
+    # calculate AIC_min for the fitted models at each time, channel
+    # in one grouped pass, float so min_delta isn't object dtype
+    _aic = AICs['AIC'].astype(float)
+    AICs['min_delta'] = _aic - _aic.groupby(
+        level=[AICs.index.names[0], 'channel'], sort=False
+    ).transform('min')
 
     FutureWarning('fitgrid AICs are in early days, subject to change')
 
@@ -623,6 +662,12 @@ def _get_AICs(summary_df):
     return AICs
 
 
+@lru_cache()
+def _by_c_m(m):
+    """Benjamini & Yekutieli c(m) harmonic sum, same for every family of m"""
+    return np.sum(1.0 / np.arange(1, m + 1))
+
+
 def summaries_fdr_control(
     model_summary_df,
     method="BY",
@@ -664,27 +709,26 @@ def summaries_fdr_control(
     """
 
     _check_summary_df(model_summary_df, None)
-    pvals_df = model_summary_df.query("key == 'P-val'")  # fetch pvals
-    pvals = np.sort(pvals_df.to_numpy().flatten())
+    # fetch pvals, xs matches the key level codes not strings
+    pvals_df = model_summary_df.xs('P-val', level='key', drop_level=False)
+    # summary columns are object dtype, sort and compare as native floats
+    pvals = np.sort(pvals_df.to_numpy(dtype=float).ravel())
     m = len(pvals)
-    ks = list()
 
     if method == 'BH':
         # Benjamini & Hochberg ... restricted
         c_m = 1
     elif method == 'BY':
         # Benjamini & Yekatuli general case
-        c_m = np.sum([1 / i for i in range(1, m + 1)])
+        c_m = _by_c_m(m)
     else:
         raise ValueError("method must be 'BH' or 'BY'")
 
-    for k, p in enumerate(pvals):
-        kmcm = k / (m * c_m)
-        if p <= kmcm * rate:
-            ks.append(k)
+    # indices k of the sorted pvals where p_k <= (k / (m * c_m)) * rate
+    ks = np.flatnonzero(pvals <= (np.arange(m) / (m * c_m)) * rate)
 
     if len(ks) > 0:
-        crit_p = pvals[max(ks)]
+        crit_p = float(pvals[ks[-1]])
         crit_p_idx = np.where(pvals < crit_p)[0].max()
     else:
         crit_p = 0.0
@@ -791,7 +835,8 @@ def plot_betas(
 
     df_func : {None, function}
         toggle degrees of freedom line plot via function, e.g.,
-        ``np.log10``, ``lambda x: x``
+        ``np.log10``, ``lambda x: x``. NumPy ufuncs are called once on
+        the array of degrees of freedom, other functions once per value.
 
     scatter_size : float
        scatterplot marker size for FDR (default = 75) and warnings (= 1.5 scatter_size)
@@ -888,16 +933,12 @@ def plot_betas(
         model_summary_df = model_summary_df.query("beta in @betas").copy()
 
     if interval:
-        model_summary_df.sort_index(inplace=True)
-        model_summary_df = model_summary_df.loc[
-            # Index = time, model, beta, key
-            pd.IndexSlice[
-                interval[0] : interval[1],
-                :,
-                :,
-                :,
-            ],
-            :,
+        # mask on time, index = time, model, beta, key. Sorting to
+        # slice would reorder the models and, unfiltered, the caller's
+        # summary_df in place.
+        times = model_summary_df.index.get_level_values(0)
+        model_summary_df = model_summary_df[
+            (times >= interval[0]) & (times <= interval[1])
         ]
 
     models = list(model_summary_df.index.unique("model"))
@@ -925,7 +966,9 @@ def plot_betas(
         np.hstack(
             [
                 w.split("_") if len(w) else []
-                for w in np.unique(summary_df.query("key=='warnings'"))
+                for w in np.unique(
+                    summary_df.xs('warnings', level='key', drop_level=False)
+                )
             ]
         )
     )
@@ -942,12 +985,18 @@ def plot_betas(
     # set up figures
     figs = list()
 
+    # unstack the keys once per model, not per channel and beta
+    model_dfs = {
+        model: model_summary_df.xs(
+            model, level='model', drop_level=False
+        ).unstack(level='key')
+        for model in models
+    }
+
     for model, col in itertools.product(models, LHS):
 
         # select beta for this model
-        for beta in model_summary_df.query("model == @model").index.unique(
-            "beta"
-        ):
+        for beta in model_dfs[model].index.unique('beta'):
 
             # start the fig, ax
             if "figsize" not in fig_kw.keys():
@@ -955,10 +1004,10 @@ def plot_betas(
 
             f, ax_beta = plt.subplots(nrows=1, ncols=1, **fig_kw)
 
-            # unstack this beta as a column for plotting
+            # this beta's keys as columns for plotting
             fg_beta = (
-                model_summary_df.loc[pd.IndexSlice[:, model, beta], col]
-                .unstack(level='key')
+                model_dfs[model][col]
+                .xs(beta, level='beta', drop_level=False)
                 .reset_index(_time)  # time label for this model_summary_df
             )
 
@@ -990,17 +1039,26 @@ def plot_betas(
                 except AttributeError:
                     func_name = str(df_func)
 
-                fg_beta['DF_'] = fg_beta['DF'].apply(lambda x: df_func(x))
+                # ufuncs are element-wise, call once on the array
+                if isinstance(df_func, np.ufunc):
+                    fg_beta['DF_'] = df_func(
+                        fg_beta['DF'].to_numpy(dtype=float)
+                    )
+                else:
+                    fg_beta['DF_'] = fg_beta['DF'].map(df_func)
                 fg_beta.plot(
                     x=_time, y='DF_', ax=ax_beta, label=f"{func_name}(df)"
                 )
 
             # FDR controlled differences from 0
             if fdr_kw:
-                fdr_mask = fg_beta["P-val"] < fdr_specs["crit_p"]
+                fdr_idx = np.flatnonzero(
+                    fg_beta["P-val"].to_numpy(dtype=float)
+                    < fdr_specs["crit_p"]
+                )
                 ax_beta.scatter(
-                    fg_beta[_time][fdr_mask],
-                    fg_beta['Estimate'][fdr_mask],
+                    fg_beta[_time].iloc[fdr_idx],
+                    fg_beta['Estimate'].iloc[fdr_idx],
                     color='black',
                     zorder=3,
                     label=f"{fdr_specs['method']} FDR p < crit {fdr_specs['crit_p']:0.2}",
@@ -1030,12 +1088,14 @@ def plot_betas(
                         np.where(warning_kinds == warn_str)[0] + 1
                     ) * sep
 
-                    warn_mask = fg_beta["warnings"].apply(
-                        lambda x: warn_str in x
+                    warn_idx = np.flatnonzero(
+                        fg_beta["warnings"]
+                        .str.contains(warn_str, regex=False)
+                        .to_numpy()
                     )
                     ax_beta.scatter(
-                        fg_beta[_time][warn_mask],
-                        fg_beta['Estimate'][warn_mask] + warn_offset,
+                        fg_beta[_time].iloc[warn_idx],
+                        fg_beta['Estimate'].iloc[warn_idx] + warn_offset,
                         zorder=4,
                         label=warn_str,
                         **warning_styles[
@@ -1211,21 +1271,17 @@ def plot_AICmin_deltas(
 
         # ------------------------------------------------------------
         # slice this model min delta values and warnings
+        model_aics = aics.xs(m, level='model')
+
+        # unstack() alphanum sorts the channel index ... ugh
         _min_deltas = (
-            aics.loc[pd.IndexSlice[:, m, :], 'min_delta']
-            .reset_index('model', drop=True)
+            model_aics['min_delta']
             .unstack('channel')
-            .astype(float)
+            .reindex(columns=channels)
         )
-        # unstack() alphanum sorts the channel index ... ugh
-        _min_deltas = _min_deltas.reindex(columns=channels)
-
         model_warnings = (
-            aics.loc[pd.IndexSlice[:, m, :], 'warnings']
-            .reset_index('model', drop=True)
-            .unstack('channel')
+            model_aics['warnings'].unstack('channel').reindex(columns=channels)
         )
-        model_warnings = model_warnings.reindex(columns=channels)
 
         # fetch warnings for heatmapping
         warning_kinds, warnings_grid = _get_warnings_grid(
@@ -1241,21 +1297,22 @@ def plot_AICmin_deltas(
             title_str += "\n" + "\n".join(warning_kinds)
         traces.set_title(title_str, loc="left")
 
-        for chan in channels:
-            traces.plot(
-                _min_deltas.reset_index()[_time], _min_deltas[chan], label=chan
-            )
-
-            # warning mask
-            chan_mask = (
-                _min_deltas[chan].where(warnings_grid[chan] == 1).dropna()
-            )
-            traces.scatter(
-                chan_mask.index,
-                chan_mask,
-                c="crimson",
-                label=None,
-            )
+        # one call plots the time x channel columns as lines
+        times = _min_deltas.index.to_numpy()
+        min_deltas = _min_deltas.to_numpy()
+        for line, chan in zip(traces.plot(times, min_deltas), channels):
+            line.set_label(chan)
+
+        # one scatter for the warnings on all channels
+        rows, cols = np.nonzero(warnings_grid.to_numpy() == 1)
+        warn_deltas = min_deltas[rows, cols]
+        has_delta = ~np.isnan(warn_deltas)
+        traces.scatter(
+            times[rows][has_delta],
+            warn_deltas[has_delta],
+            c="crimson",
+            label=None,
+        )
 
         if i == 0:
             # first channel legend left of the main plot
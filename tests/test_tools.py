@@ -106,6 +106,13 @@ def test_single_threaded_change_before():
     assert blas.get_n_threads() == BEFORE
 
 
+def test_get_blas_cached():
+
+    import numpy
+
+    assert tools.get_blas(numpy) is tools.get_blas(numpy)
+
+
 def test_design_matrix_is_constant():
 
     df = pd.DataFrame(
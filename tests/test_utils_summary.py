@@ -375,6 +375,32 @@ def test_summarize():
     return summary_dfs
 
 
+def test_summarize_parallel_models():
+    """fitting whole models in parallel matches fitting them serially"""
+
+    RHSs = [
+        "1 + continuous + categorical",
+        "1 + continuous",
+        "1 + categorical",
+        "1",
+    ]
+    epochs_fg = _get_epochs_fg(seed=0)
+
+    serial_df = fitgrid.utils.summary.summarize(
+        epochs_fg, 'lm', LHS=epochs_fg.channels, RHS=RHSs, parallel=False
+    )
+    parallel_df = fitgrid.utils.summary.summarize(
+        epochs_fg,
+        'lm',
+        LHS=epochs_fg.channels,
+        RHS=RHSs,
+        parallel=True,
+        n_cores=2,
+    )
+    assert RHSs == parallel_df.index.unique('model').to_list()
+    pd.testing.assert_frame_equal(serial_df, parallel_df)
+
+
 # ------------------------------------------------------------
 # lmer kwarg test values from frozen random number generator
 # ------------------------------------------------------------
@@ -604,6 +630,27 @@ def test_lm_plot_betas_AICmin_deltas():
         )
         plt.close('all')
 
+        # scalar-only df_func is applied per value, ufunc on the array
+        for df_func in [lambda x: max(x, 1.0), np.log10]:
+            fitgrid.utils.summary.plot_betas(
+                lm_summaries,
+                LHS=["channel0"],
+                models=["1 + continuous"],
+                df_func=df_func,
+            )
+            plt.close('all')
+
+        # interval selection must not reorder the caller's summaries
+        rev_summaries = pd.concat(
+            [lm_summaries.query("model == @rhs") for rhs in lm_rhs[::-1]]
+        )
+        rev_summaries_copy = rev_summaries.copy()
+        fitgrid.utils.summary.plot_betas(
+            rev_summaries, LHS=rev_summaries.columns.tolist(), interval=[2, 6]
+        )
+        plt.close('all')
+        pd.testing.assert_frame_equal(rev_summaries, rev_summaries_copy)
+
 
 def test_lmer_warnings_plot_betas_AICmin_deltas():
     """test lmer warnings and summary plotting"""